@@ -1,12 +1,15 @@
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, make_response
 from flask_cors import CORS
+from flask_compress import Compress
 import os
+import hashlib
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from config import config
-from utils.heatmap import generate_city_demand_heatmap, map_to_html
-from utils.getData import read_data
+from utils.heatmap import process_city_demand, city_demand_to_points, create_heatmap_from_points, map_to_html
+from utils.getData import DATA_PATH, read_data, read_data_cached
 from utils.responseTime import calculate_response_time
 from utils.veh_count import calculate_veh_count
 from utils.predicting.predict_demand import predict_demand as forecast_demand
@@ -35,6 +38,9 @@ app.config.from_object(config[env])
 # Enable CORS for cross-origin requests from frontend
 CORS(app)
 
+# Compress responses (gzip/br) when the client accepts it
+Compress(app)
+
 @app.route('/api/veh_count', methods=['GET'])
 def get_veh_count():
     """Get veh count data"""
@@ -61,14 +67,56 @@ def get_veh_count():
         'data': veh_count
     })
 
+@lru_cache(maxsize=4)
+def _heatmap_points(mtime: float) -> list:
+    """Compute the heatmap [lat, lon, weight] points once per data file version."""
+    return city_demand_to_points(process_city_demand(read_data_cached()))
+
+@lru_cache(maxsize=8)
+def _render_heatmap_html(mtime: float, zoom_start: int, radius: int) -> str:
+    """Render the heatmap HTML once per data file version and map settings."""
+    map_obj = create_heatmap_from_points(_heatmap_points(mtime), zoom_start=zoom_start, radius=radius)
+    return map_to_html(map_obj)
+
 @app.route('/api/heatmap',methods=['GET'])
 def get_heatmap():
-    """Get heatmap visualization"""
-    df = read_data()
-    map_obj = generate_city_demand_heatmap(df)
-    html_map = map_to_html(map_obj)
+    """
+    Get heatmap visualization.
+    
+    Query parameters:
+    - zoom_start: Initial zoom level, 0-18 (default: 6)
+    - radius: Heatmap radius, 1-100 (default: 10)
+    """
+    try:
+        zoom_start = int(request.args.get('zoom_start', 6))
+        radius = int(request.args.get('radius', 10))
+    except ValueError:
+        return jsonify({
+            'status': 'error',
+            'message': 'zoom_start and radius must be integers'
+        }), 400
 
-    return html_map
+    if zoom_start < 0 or zoom_start > 18:
+        return jsonify({
+            'status': 'error',
+            'message': 'zoom_start must be between 0 and 18'
+        }), 400
+
+    if radius < 1 or radius > 100:
+        return jsonify({
+            'status': 'error',
+            'message': 'radius must be between 1 and 100'
+        }), 400
+
+    mtime = os.path.getmtime(DATA_PATH)
+    html_map = _render_heatmap_html(mtime, zoom_start, radius)
+
+    # The rendered HTML only changes with the data file, so browsers can revalidate
+    etag = hashlib.md5(f"{mtime}-{zoom_start}-{radius}".encode()).hexdigest()
+    response = make_response(html_map)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=300'
+    return response.make_conditional(request)
 
 @app.route('/api/indicators', methods=['GET'])
 def get_indicators():
@@ -1113,7 +1161,22 @@ def test():
         }
     })
 
+def warm_caches():
+    """
+    Populate the in-process data caches before serving requests.
+    
+    Under gunicorn with preload_app, this runs once in the master process and
+    the parsed data is shared copy-on-write by the forked workers.
+    """
+    try:
+        read_data_cached()
+        _render_heatmap_html(os.path.getmtime(DATA_PATH), 6, 10)
+    except Exception as e:
+        print(f"Warning: failed to warm data caches: {str(e)}")
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
     app.run(host='0.0.0.0', port=port, debug=app.config['DEBUG'])
+else:
+    warm_caches()
 
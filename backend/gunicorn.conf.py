@@ -0,0 +1,11 @@
+# Gunicorn configuration for production deployments.
+# Usage (from the backend directory): gunicorn app:app -c gunicorn.conf.py
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+
+# Import the app (and warm its data caches) once in the master process so the
+# parsed data is shared copy-on-write by all forked workers
+preload_app = True
@@ -16,6 +16,7 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
+from functools import lru_cache
 try:
     from scipy import stats
     SCIPY_AVAILABLE = True
@@ -37,7 +38,12 @@ def get_hospital_closure_events() -> pd.DataFrame:
     if not hospital_path.exists():
         return pd.DataFrame()
     
-    df = pd.read_csv(hospital_path)
+    df = pd.read_csv(
+        hospital_path,
+        usecols=['hospital_name', 'county', 'facility_type', 'closure_date',
+                 'closure_year', 'reason', 'status'],
+        dtype={'closure_date': 'str', 'facility_type': 'category', 'status': 'category'}
+    )
     
     # Filter for valid closure events (must have closure_year and status is Closed/Sold)
     valid_events = df[
@@ -49,15 +55,16 @@ def get_hospital_closure_events() -> pd.DataFrame:
     # Convert closure_year to int
     valid_events['closure_year'] = valid_events['closure_year'].astype(int)
     
-    # Parse closure_date to get month (if available)
-    valid_events['closure_month'] = valid_events['closure_date'].apply(
-        lambda x: int(x.split('-')[1]) if pd.notna(x) and '-' in str(x) else 6  # Default to June if unknown
-    )
+    # Parse closure_date to get month (if available); year-only dates fail the
+    # format and default to June
+    closure_dates = pd.to_datetime(valid_events['closure_date'], format='%Y-%m', errors='coerce')
+    valid_events['closure_month'] = closure_dates.dt.month.fillna(6).astype(int)
     
     # Create event identifier
-    valid_events['event_id'] = valid_events.apply(
-        lambda row: f"{row['hospital_name']} ({row['county']}, {int(row['closure_year'])})",
-        axis=1
+    valid_events['event_id'] = (
+        valid_events['hospital_name'].astype(str) + ' (' +
+        valid_events['county'].astype(str) + ', ' +
+        valid_events['closure_year'].astype(str) + ')'
     )
     
     return valid_events[['event_id', 'hospital_name', 'county', 'facility_type', 
@@ -78,67 +85,180 @@ def aggregate_monthly_data(
     Returns:
         DataFrame with monthly aggregated data
     """
-    # Extract date components
-    df = df.copy()
-    df['tdate'] = pd.to_datetime(df['tdate'], errors='coerce')
+    # Copy only the columns used below rather than the full operational frame
+    columns = [
+        c for c in ['tdate', 'year_month', 'PU City', 'PU City.1', 'Incident Number',
+                    '_pu_city_u', '_pu_county_u']
+        if c in df.columns
+    ]
+    df = df[columns].copy()
+    
+    # Extract date components (already parsed on the frame from read_data_cached())
+    if not pd.api.types.is_datetime64_any_dtype(df['tdate']):
+        df['tdate'] = pd.to_datetime(df['tdate'], errors='coerce')
     df = df[df['tdate'].notna()]
-    df['year'] = df['tdate'].dt.year
-    df['month'] = df['tdate'].dt.month
-    df['year_month'] = df['tdate'].dt.to_period('M')
-    df['date'] = df['year_month'].dt.to_timestamp()
+    if 'year_month' not in df.columns:
+        df['year_month'] = df['tdate'].dt.to_period('M')
     
-    # Apply location filter if specified
+    # Apply location filter if specified (using the pre-upper-cased columns
+    # attached by read_data_cached() when available)
     if location_filter:
         if 'county' in location_filter:
-            df['PU City.1'] = df['PU City.1'].str.upper()
-            df = df[df['PU City.1'] == location_filter['county'].upper()]
+            county = df['_pu_county_u'] if '_pu_county_u' in df.columns else df['PU City.1'].str.upper()
+            df = df[county == location_filter['county'].upper()]
         if 'city' in location_filter:
-            df['PU City'] = df['PU City'].str.upper()
-            df = df[df['PU City'] == location_filter['city'].upper()]
-    
-    # Aggregate by month
-    monthly_agg = df.groupby('year_month').agg({
-        'Incident Number': 'count',  # Count missions
-        'tdate': 'min',  # Keep first date for reference
-        'year': 'first',
-        'month': 'first'
-    }).reset_index()
-    monthly_agg.columns = ['year_month', 'mission_count', 'date', 'year', 'month']
-    monthly_agg['date'] = monthly_agg['year_month'].dt.to_timestamp()
+            city = df['_pu_city_u'] if '_pu_city_u' in df.columns else df['PU City'].str.upper()
+            df = df[city == location_filter['city'].upper()]
     
-    # Sort by date
-    monthly_agg = monthly_agg.sort_values('date')
+    # Count missions by month (groupby returns the months in sorted order);
+    # date, year and month are all derived from the period key
+    monthly_agg = df.groupby('year_month')['Incident Number'].count().rename('mission_count').reset_index()
+    monthly_agg['date'] = monthly_agg['year_month'].dt.to_timestamp()
+    monthly_agg['year'] = monthly_agg['year_month'].dt.year
+    monthly_agg['month'] = monthly_agg['year_month'].dt.month
     
     return monthly_agg[['date', 'year', 'month', 'year_month', 'mission_count']]
 
 
+@lru_cache(maxsize=64)
+def _cached_monthly_data(
+    data_mtime: float,
+    location_key: Tuple[Tuple[str, str], ...]
+) -> pd.DataFrame:
+    """
+    Aggregate the cached operational data by month for one location.
+    
+    Args:
+        data_mtime: Modification time of the operational data file (cache key only)
+        location_key: Sorted (field, upper-cased value) pairs of the location filter
+    
+    Returns:
+        DataFrame with monthly aggregated data (shared between callers, do not mutate)
+    """
+    from utils.getData import read_data_cached
+    
+    return aggregate_monthly_data(read_data_cached(), dict(location_key) or None)
+
+
+def get_monthly_data(location_filter: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Get monthly aggregated operational data, reusing earlier aggregations.
+    
+    The aggregation for each location is computed once and reused until the
+    operational data file changes.
+    
+    Args:
+        location_filter: Dictionary with filter criteria (e.g., {'county': 'Aroostook'})
+    
+    Returns:
+        DataFrame with monthly aggregated data (shared between callers, do not mutate)
+    """
+    from utils.getData import get_data_mtime
+    
+    location_key = tuple(sorted(
+        (field, str(value).upper()) for field, value in (location_filter or {}).items()
+    ))
+    return _cached_monthly_data(get_data_mtime(), location_key)
+
+
+def _period_records(period_data: pd.DataFrame, period: str) -> List[Dict[str, Any]]:
+    """
+    Convert monthly rows into visualization records.
+    
+    Args:
+        period_data: Monthly aggregated data with date and mission_count columns
+        period: Period label ('pre' or 'post')
+    
+    Returns:
+        List of dictionaries with date, mission_count and period
+    """
+    dates = period_data['date'].dt.strftime('%Y-%m-%dT%H:%M:%S').tolist()
+    counts = period_data['mission_count'].astype(int).tolist()
+    return [
+        {'date': date, 'mission_count': count, 'period': period}
+        for date, count in zip(dates, counts)
+    ]
+
+
+def _window_positions(
+    monthly_data: pd.DataFrame,
+    event_date: datetime,
+    window_months: int
+) -> Tuple[int, int, int]:
+    """
+    Find the analysis window in date-sorted monthly data by binary search.
+    
+    Args:
+        monthly_data: Monthly aggregated data, sorted by date
+        event_date: Event date
+        window_months: Number of months before and after the event
+    
+    Returns:
+        Tuple of row positions (start, split, end): rows [start, end) fall within
+        the window and rows before split are dated before the event
+    """
+    event_period = pd.Period(event_date, freq='M')
+    start_date = (event_period - window_months).to_timestamp()
+    end_date = (event_period + window_months).to_timestamp()
+    
+    dates = monthly_data['date']
+    start = int(dates.searchsorted(start_date, side='left'))
+    split = int(dates.searchsorted(pd.Timestamp(event_date), side='left'))
+    end = int(dates.searchsorted(end_date, side='right'))
+    return start, split, end
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """
+    Sample standard deviation (ddof=1) with the same edge cases as pandas.
+    
+    Args:
+        values: 1-D array of observations
+    
+    Returns:
+        0.0 for an empty array, NaN for a single value, otherwise the sample std
+    """
+    if values.size == 0:
+        return 0.0
+    if values.size == 1:
+        return np.nan
+    return values.std(ddof=1)
+
+
+@lru_cache(maxsize=64)
+def _t_critical(dof: int) -> float:
+    """
+    Two-sided 95% critical value of Student's t distribution.
+    
+    The degrees of freedom are bounded by the analysis window, so only a handful
+    of distinct values are ever requested.
+    """
+    return float(stats.t.ppf(0.975, dof))
+
+
 def calculate_pre_post_comparison(
     monthly_data: pd.DataFrame,
     event_date: datetime,
-    window_months: int = 12
+    window_months: int = 12,
+    compute_stats: bool = True
 ) -> Dict[str, Any]:
     """
     Calculate pre/post event comparison using event study methodology.
     
     Args:
-        monthly_data: Monthly aggregated data
+        monthly_data: Monthly aggregated data, sorted by date
         event_date: Event date (hospital closure date)
         window_months: Number of months before and after event to analyze
+        compute_stats: Whether to run the t-test and confidence interval.
+                       If False, 'confidence_interval' and 'p_value' are None.
     
     Returns:
         Dictionary with pre/post comparison results
     """
-    # Convert event_date to period for comparison
-    event_period = pd.Period(event_date, freq='M')
-    
-    # Filter data within window
-    start_date = (event_period - window_months).to_timestamp()
-    end_date = (event_period + window_months).to_timestamp()
-    
-    window_data = monthly_data[
-        (monthly_data['date'] >= start_date) &
-        (monthly_data['date'] <= end_date)
-    ].copy()
+    # Locate the window and the event within the sorted monthly data
+    start, split, end = _window_positions(monthly_data, event_date, window_months)
+    split = min(max(split, start), end)
+    window_data = monthly_data.iloc[start:end]
     
     if len(window_data) == 0:
         return {
@@ -153,61 +273,49 @@ def calculate_pre_post_comparison(
             'event_date': event_date
         }
     
-    # Split into pre and post periods
-    pre_period = window_data[window_data['date'] < event_date]
-    post_period = window_data[window_data['date'] >= event_date]
+    # Split into pre and post periods at the event position
+    pre_period = monthly_data.iloc[start:split]
+    post_period = monthly_data.iloc[split:end]
+    pre_counts = pre_period['mission_count'].to_numpy()
+    post_counts = post_period['mission_count'].to_numpy()
+    pre_n = pre_counts.size
+    post_n = post_counts.size
     
     # Calculate statistics
-    pre_mean = pre_period['mission_count'].mean() if len(pre_period) > 0 else 0.0
-    post_mean = post_period['mission_count'].mean() if len(post_period) > 0 else 0.0
-    pre_std = pre_period['mission_count'].std() if len(pre_period) > 0 else 0.0
-    post_std = post_period['mission_count'].std() if len(post_period) > 0 else 0.0
+    pre_mean = pre_counts.mean() if pre_n > 0 else 0.0
+    post_mean = post_counts.mean() if post_n > 0 else 0.0
+    pre_std = _sample_std(pre_counts)
+    post_std = _sample_std(post_counts)
     
     difference = post_mean - pre_mean
     percentage_change = (difference / pre_mean * 100) if pre_mean > 0 else 0.0
     
     # Calculate confidence intervals (simple approximation)
-    pre_n = len(pre_period)
-    post_n = len(post_period)
-    
-    if SCIPY_AVAILABLE and pre_n > 1 and post_n > 1:
-        # T-test for difference in means
-        t_stat, p_value = stats.ttest_ind(
-            pre_period['mission_count'].values,
-            post_period['mission_count'].values
-        )
+    confidence_interval = None
+    p_value = None
+    if compute_stats:
+        if SCIPY_AVAILABLE and pre_n > 1 and post_n > 1:
+            # T-test for difference in means
+            t_stat, p_value = stats.ttest_ind(pre_counts, post_counts)
+            
+            # Standard error of difference
+            se_diff = np.sqrt((pre_std**2 / pre_n) + (post_std**2 / post_n))
+            t_critical = _t_critical(min(pre_n, post_n) - 1)
+        else:
+            # Simple approximation
+            se_diff = np.sqrt((pre_std**2 / max(pre_n, 1)) + (post_std**2 / max(post_n, 1)))
+            t_critical = 1.96  # Z-score
+            p_value = 0.05  # Placeholder
         
-        # Standard error of difference
-        se_diff = np.sqrt((pre_std**2 / pre_n) + (post_std**2 / post_n))
-        t_critical = stats.t.ppf(0.975, min(pre_n, post_n) - 1)
-        ci_lower = difference - t_critical * se_diff
-        ci_upper = difference + t_critical * se_diff
-    else:
-        # Simple approximation
-        se_diff = np.sqrt((pre_std**2 / max(pre_n, 1)) + (post_std**2 / max(post_n, 1)))
-        t_critical = 1.96  # Z-score
-        ci_lower = difference - t_critical * se_diff
-        ci_upper = difference + t_critical * se_diff
-        p_value = 0.05  # Placeholder
-    
-    # Prepare data for visualization
-    pre_data = [
-        {
-            'date': row['date'].isoformat(),
-            'mission_count': int(row['mission_count']),
-            'period': 'pre'
+        confidence_interval = {
+            'lower': float(difference - t_critical * se_diff),
+            'upper': float(difference + t_critical * se_diff)
         }
-        for _, row in pre_period.iterrows()
-    ]
+        p_value = float(p_value) if SCIPY_AVAILABLE else 0.05
     
-    post_data = [
-        {
-            'date': row['date'].isoformat(),
-            'mission_count': int(row['mission_count']),
-            'period': 'post'
-        }
-        for _, row in post_period.iterrows()
-    ]
+    # Prepare data for visualization
+    pre_data = _period_records(pre_period, 'pre')
+    post_data = _period_records(post_period, 'post')
     
     return {
         'pre_period_mean': float(pre_mean),
@@ -218,11 +326,8 @@ def calculate_pre_post_comparison(
         'post_period_std': float(post_std),
         'pre_period_n': int(pre_n),
         'post_period_n': int(post_n),
-        'confidence_interval': {
-            'lower': float(ci_lower),
-            'upper': float(ci_upper)
-        },
-        'p_value': float(p_value) if SCIPY_AVAILABLE else 0.05,
+        'confidence_interval': confidence_interval,
+        'p_value': p_value,
         'pre_period_data': pre_data,
         'post_period_data': post_data,
         'event_date': event_date.isoformat(),
@@ -239,47 +344,44 @@ def calculate_cumulative_impact(
     Calculate cumulative impact over time after the event.
     
     Args:
-        monthly_data: Monthly aggregated data
+        monthly_data: Monthly aggregated data, sorted by date
         event_date: Event date
         window_months: Number of months to calculate impact for
     
     Returns:
         List of cumulative impact data points
     """
-    # Get pre-period mean as baseline
-    event_period = pd.Period(event_date, freq='M')
-    start_date = (event_period - window_months).to_timestamp()
+    start, split, end = _window_positions(monthly_data, event_date, window_months)
     
-    pre_period = monthly_data[
-        (monthly_data['date'] >= start_date) &
-        (monthly_data['date'] < event_date)
-    ]
+    # Get pre-period mean as baseline
+    pre_period = monthly_data.iloc[start:max(split, start)]
     
     baseline_mean = pre_period['mission_count'].mean() if len(pre_period) > 0 else 0.0
     
     # Get post-period data
-    end_date = (event_period + window_months).to_timestamp()
-    post_period = monthly_data[
-        (monthly_data['date'] >= event_date) &
-        (monthly_data['date'] <= end_date)
-    ].sort_values('date')
+    post_period = monthly_data.iloc[split:max(end, split)]
     
     # Calculate cumulative impact
-    cumulative_data = []
-    cumulative_excess = 0.0
+    counts = post_period['mission_count'].to_numpy()
+    excess = counts - baseline_mean
+    cumulative_excess = np.cumsum(excess)
     
-    for _, row in post_period.iterrows():
-        excess = row['mission_count'] - baseline_mean
-        cumulative_excess += excess
-        
-        cumulative_data.append({
-            'date': row['date'].isoformat(),
-            'mission_count': int(row['mission_count']),
+    dates = post_period['date'].dt.strftime('%Y-%m-%dT%H:%M:%S').tolist()
+    months_since_event = ((post_period['date'] - event_date).dt.days // 30).tolist()  # Approximate months
+    
+    cumulative_data = [
+        {
+            'date': date,
+            'mission_count': int(count),
             'baseline': float(baseline_mean),
-            'excess': float(excess),
-            'cumulative_excess': float(cumulative_excess),
-            'months_since_event': int((row['date'] - event_date).days / 30)  # Approximate months
-        })
+            'excess': float(exc),
+            'cumulative_excess': float(cum),
+            'months_since_event': int(months)
+        }
+        for date, count, exc, cum, months in zip(
+            dates, counts.tolist(), excess.tolist(), cumulative_excess.tolist(), months_since_event
+        )
+    ]
     
     return cumulative_data
 
@@ -302,8 +404,6 @@ def get_event_impact_analysis(
     Returns:
         Dictionary with event impact analysis results
     """
-    from utils.getData import read_data
-    
     # Get event details
     events_df = get_hospital_closure_events()
     event = events_df[events_df['event_id'] == event_id]
@@ -316,9 +416,6 @@ def get_event_impact_analysis(
     event_month = int(event_row['closure_month'])
     event_date = datetime(event_year, event_month, 1)
     
-    # Get operational data
-    df = read_data()
-    
     # Apply location filter
     location_filter = None
     if location_level == 'county' and location_value:
@@ -329,8 +426,8 @@ def get_event_impact_analysis(
         # Use event county if location_value not specified
         location_filter = {'county': event_row['county']}
     
-    # Aggregate monthly data
-    monthly_data = aggregate_monthly_data(df, location_filter)
+    # Aggregate monthly data (cached per location)
+    monthly_data = get_monthly_data(location_filter)
     
     # Calculate pre/post comparison
     pre_post = calculate_pre_post_comparison(monthly_data, event_date, window_months)
@@ -389,15 +486,16 @@ def get_all_events() -> List[Dict[str, str]]:
     """
     events_df = get_hospital_closure_events()
     
-    events_list = []
-    for _, row in events_df.iterrows():
-        events_list.append({
+    events_list = [
+        {
             'event_id': row['event_id'],
             'display_name': f"{row['hospital_name']} - {row['county']} ({int(row['closure_year'])})",
             'county': row['county'],
             'facility_type': row['facility_type'],
             'closure_year': int(row['closure_year'])
-        })
+        }
+        for row in events_df.to_dict(orient='records')
+    ]
     
     # Sort by closure year (most recent first)
     events_list.sort(key=lambda x: x['closure_year'], reverse=True)
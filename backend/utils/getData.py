@@ -1,14 +1,116 @@
 import pandas as pd
 import os
+import threading
+from functools import lru_cache
+try:
+    import pyarrow  # noqa: F401  (parquet engine)
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+    print("Warning: pyarrow not available. Parsed data will not be cached as parquet.")
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', '1_demand_forecasting', 'data.csv')
+
+# Bump when the cached frame's columns or dtypes change so stale parquet files are ignored
+CACHE_VERSION = 2
+
+# Columns kept in the cached frame (everything its consumers reference)
+CACHED_COLUMNS = ['tdate', 'PU City', 'PU City.1', 'Incident Number']
+CACHED_DTYPES = {'PU City': 'category', 'PU City.1': 'category'}
+
+
+def _parquet_cache_path(path: str) -> str:
+    """Path of the parquet cache stored next to a CSV file."""
+    return f"{os.path.splitext(path)[0]}.cache-v{CACHE_VERSION}.parquet"
+
+
+def _write_parquet_cache(df: pd.DataFrame, cache_path: str) -> None:
+    """
+    Write the parsed frame to its parquet cache.
+
+    The file is written under a temporary name unique to the process and
+    thread and moved into place, so that a concurrent reader never sees a
+    partial file and concurrent writers do not share a temporary file. Failures are not fatal: the
+    CSV is simply parsed again next time.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: could not write parquet cache {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@lru_cache(maxsize=4)
+def _load_operational_frame(path: str, mtime: float) -> pd.DataFrame:
+    """
+    Load the operational data frame once per (path, mtime).
+
+    Only CACHED_COLUMNS are parsed; the mtime in the cache key makes edits to
+    the CSV take effect on the next call. When pyarrow is available the result
+    is also stored as parquet next to the CSV and read from there while it is
+    newer than the CSV. The frame contains:
+
+    - 'tdate' parsed to datetime (unparseable dates become NaT)
+    - 'year_month': monthly period of 'tdate'
+    - 'PU City' / 'PU City.1' as categoricals
+    - '_pu_city_u' / '_pu_county_u': upper-cased categorical copies used by
+      case-insensitive location filters
+    """
+    cache_path = _parquet_cache_path(path)
+    if PARQUET_AVAILABLE and os.path.exists(cache_path) and os.path.getmtime(cache_path) >= mtime:
+        try:
+            return pd.read_parquet(cache_path)
+        except (OSError, ValueError) as e:
+            # Unreadable cache (corrupt, wrong owner, ...): parse the CSV and rewrite it
+            print(f"Warning: could not read parquet cache {cache_path}: {e}")
+
+    df = pd.read_csv(path, encoding='latin1', usecols=CACHED_COLUMNS, dtype=CACHED_DTYPES)
+    df['tdate'] = pd.to_datetime(df['tdate'], errors='coerce')
+    df['year_month'] = df['tdate'].dt.to_period('M')
+    df['_pu_city_u'] = df['PU City'].str.upper().astype('category')
+    df['_pu_county_u'] = df['PU City.1'].str.upper().astype('category')
+
+    if PARQUET_AVAILABLE:
+        _write_parquet_cache(df, cache_path)
+    return df
+
 
 def read_data() -> pd.DataFrame:
     """
     Read data from a CSV file.
-    
+
     Args:
         file_path: Path to the CSV file
     Returns:
         DataFrame
     """
-    file_path = os.path.join(os.path.dirname(__file__), '..', 'data','1_demand_forecasting', 'data.csv')
-    return pd.read_csv(file_path, encoding='latin1')
\ No newline at end of file
+    return pd.read_csv(DATA_PATH, encoding='latin1')
+
+
+def get_data_mtime() -> float:
+    """
+    Get the modification time of the operational data file.
+
+    Used as a cache key by callers that memoise results derived from the data.
+
+    Returns:
+        File modification time in seconds since the epoch
+    """
+    return os.path.getmtime(DATA_PATH)
+
+
+def read_data_cached() -> pd.DataFrame:
+    """
+    Read data from the CSV file, reusing the parsed frame while the file is unchanged.
+
+    Only CACHED_COLUMNS (plus derived lookup columns) are loaded. The returned
+    DataFrame is shared between callers and must not be mutated; use
+    read_data() when a private copy of the full data is needed.
+
+    Returns:
+        DataFrame
+    """
+    return _load_operational_frame(DATA_PATH, get_data_mtime())
@@ -18,6 +18,26 @@ def get_city_coordinates() -> Dict[str, Tuple[float, float]]:
     return city_coordinates
 
 
+def coordinates_to_frame(city_coordinates: Dict[str, Tuple[float, float]]) -> pd.DataFrame:
+    """
+    Convert a city coordinates dictionary into a DataFrame indexed by city name.
+    
+    Args:
+        city_coordinates: Dictionary mapping city names to (lat, lon) tuples.
+    
+    Returns:
+        DataFrame with latitude and longitude columns.
+    """
+    return pd.DataFrame.from_dict(
+        city_coordinates, orient='index', columns=['latitude', 'longitude']
+    )
+
+
+# The coordinates file is static, so it is parsed once at import
+_CITY_COORDS = get_city_coordinates()
+_CITY_COORDS_DF = coordinates_to_frame(_CITY_COORDS)
+
+
 def process_city_demand(
     df: pd.DataFrame,
     city_coordinates: Optional[Dict[str, Tuple[float, float]]] = None
@@ -34,18 +54,15 @@ def process_city_demand(
         Processed DataFrame with latitude, longitude, and task_count columns.
     """
     if city_coordinates is None:
-        city_coordinates = get_city_coordinates()
+        coords_df = _CITY_COORDS_DF
+    else:
+        coords_df = coordinates_to_frame(city_coordinates)
     
     # Aggregate task demand by city
-    city_demand = df.groupby('PU City').size().reset_index(name='task_count')
+    city_demand = df.groupby('PU City', observed=True).size().reset_index(name='task_count')
     
-    # Add coordinates
-    city_demand['latitude'] = city_demand['PU City'].apply(
-        lambda x: city_coordinates.get(x, (None, None))[0]
-    )
-    city_demand['longitude'] = city_demand['PU City'].apply(
-        lambda x: city_coordinates.get(x, (None, None))[1]
-    )
+    # Add coordinates with a single hashed join instead of per-row lookups
+    city_demand = city_demand.join(coords_df, on='PU City')
     
     # Remove rows with missing coordinates
     city_demand.dropna(subset=['latitude', 'longitude'], inplace=True)
@@ -53,20 +70,33 @@ def process_city_demand(
     return city_demand
 
 
-def create_heatmap(
-    city_demand: pd.DataFrame,
+def city_demand_to_points(city_demand: pd.DataFrame) -> List[List[float]]:
+    """
+    Convert processed city demand into heatmap points.
+    
+    Args:
+        city_demand: DataFrame containing latitude, longitude, and task_count columns
+    
+    Returns:
+        List of [lat, lon, weight] points
+    """
+    return city_demand[['latitude', 'longitude', 'task_count']].values.tolist()
+
+
+def create_heatmap_from_points(
+    points: List[List[float]],
     center_lat: Optional[float] = None,
     center_lon: Optional[float] = None,
     zoom_start: int = 6,
     radius: int = 10
 ) -> folium.Map:
     """
-    Create a heatmap visualization.
+    Create a heatmap visualization from precomputed points.
     
     Args:
-        city_demand: DataFrame containing latitude, longitude, and task_count columns
-        center_lat: Map center latitude. If None, uses mean of data latitudes.
-        center_lon: Map center longitude. If None, uses mean of data longitudes.
+        points: List of [lat, lon, weight] points (see city_demand_to_points)
+        center_lat: Map center latitude. If None, uses mean of point latitudes.
+        center_lon: Map center longitude. If None, uses mean of point longitudes.
         zoom_start: Initial zoom level
         radius: Heatmap radius
     
@@ -74,22 +104,50 @@ def create_heatmap(
         folium.Map object
     """
     if center_lat is None:
-        center_lat = city_demand['latitude'].mean()
+        center_lat = pd.Series([p[0] for p in points], dtype=float).mean()
     if center_lon is None:
-        center_lon = city_demand['longitude'].mean()
+        center_lon = pd.Series([p[1] for p in points], dtype=float).mean()
     
     m = folium.Map(
         location=[center_lat, center_lon],
         zoom_start=zoom_start
     )
-    # Prepare heatmap data: [[lat, lon, weight], ...]
-    heatmap_data = city_demand[['latitude', 'longitude', 'task_count']].values.tolist()
     
     # Add heatmap layer
-    HeatMap(data=heatmap_data, radius=radius).add_to(m)
+    HeatMap(data=points, radius=radius).add_to(m)
     
     return m
 
+
+def create_heatmap(
+    city_demand: pd.DataFrame,
+    center_lat: Optional[float] = None,
+    center_lon: Optional[float] = None,
+    zoom_start: int = 6,
+    radius: int = 10
+) -> folium.Map:
+    """
+    Create a heatmap visualization.
+    
+    Args:
+        city_demand: DataFrame containing latitude, longitude, and task_count columns
+        center_lat: Map center latitude. If None, uses mean of data latitudes.
+        center_lon: Map center longitude. If None, uses mean of data longitudes.
+        zoom_start: Initial zoom level
+        radius: Heatmap radius
+    
+    Returns:
+        folium.Map object
+    """
+    # Prepare heatmap data: [[lat, lon, weight], ...]
+    return create_heatmap_from_points(
+        city_demand_to_points(city_demand),
+        center_lat=center_lat,
+        center_lon=center_lon,
+        zoom_start=zoom_start,
+        radius=radius
+    )
+
 def generate_city_demand_heatmap(
     df: pd.DataFrame,
     city_coordinates: Optional[Dict[str, Tuple[float, float]]] = None,
@@ -11,52 +11,212 @@ Chart 2.4: Weather-Driven Risk Boxes (Extreme Weather Frequency vs. Demand)
 - Guides contingency staffing/aircraft redundancy policies
 """
 
+import os
+import hashlib
+import threading
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    print("Warning: pyarrow not available. Weather data will be read from CSV.")
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("Warning: numba not available. Extreme weather frequency will be computed with pandas.")
+
+BACKEND_DIR = Path(__file__).parent.parent
+WEATHER_PATH = BACKEND_DIR / 'data' / '1_demand_forecasting' / 'maine_weather_1997_2025.csv'
+PROCESSED_DIR = BACKEND_DIR / 'data' / 'processed'
+OPS_WEATHER_PATH = PROCESSED_DIR / 'operational_with_weather.csv'
+
+# Bump when the stratified frame's contents change so stale parquet files are ignored
+STRATIFIED_CACHE_VERSION = 3
+STRATIFIED_COLUMNS = ['weather_quantile', 'Incident Number']
+
+# Columns read from the source files (everything referenced downstream)
+WEATHER_COLUMNS = ['Month', 'AvgTemp', 'MinTemp', 'MaxTemp', 'Precip']
+OPS_WEATHER_COLUMNS = ['tdate', 'Incident Number', 'year', 'month',
+                       'avg_temp', 'min_temp', 'max_temp', 'precip']
+
+# Narrow in-memory dtypes for the numeric columns (halves the bytes moved per row)
+WEATHER_DTYPES = {'AvgTemp': 'float32', 'MinTemp': 'float32',
+                  'MaxTemp': 'float32', 'Precip': 'float32'}
+OPS_WEATHER_DTYPES = {'year': 'int16', 'month': 'int8',
+                      'avg_temp': 'float32', 'min_temp': 'float32',
+                      'max_temp': 'float32', 'precip': 'float32'}
+
+
+def _write_table(table: 'pa.Table', parquet_path: Path) -> None:
+    """
+    Write an Arrow table as zstd-compressed parquet.
+    
+    The file is written under a temporary name unique to the process and
+    thread and moved into place, so that concurrent readers never see a
+    partial file and concurrent writers do not share a temporary file. On failure the temporary
+    file is removed and the error is re-raised.
+    
+    Args:
+        table: Table to write
+        parquet_path: Destination path
+    """
+    tmp_path = parquet_path.with_name(f"{parquet_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        pq.write_table(table, tmp_path, compression='zstd')
+        os.replace(tmp_path, parquet_path)
+    except (OSError, ValueError):
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+
+def _parquet_column_names(parquet_path: Path) -> set:
+    """Column names of a parquet file, or an empty set if it cannot be read."""
+    try:
+        return set(pq.read_schema(parquet_path).names)
+    except (OSError, ValueError):
+        return set()
+
+
+def _ensure_parquet(csv_path: Path, columns: List[str]) -> Path:
+    """
+    Convert selected columns of a CSV file to a zstd-compressed parquet file stored next to it.
+    
+    The parquet file is regenerated when it is missing, unreadable, older than
+    the CSV or lacks any of the requested columns. Only those columns are
+    converted, so type inference problems elsewhere in the CSV do not matter.
+    
+    Args:
+        csv_path: Path to the source CSV file
+        columns: Columns the parquet file must contain
+    
+    Returns:
+        Path to the parquet file
+    """
+    parquet_path = csv_path.with_suffix('.parquet')
+    if (
+        not parquet_path.exists()
+        or parquet_path.stat().st_mtime < csv_path.stat().st_mtime
+        or not set(columns) <= _parquet_column_names(parquet_path)
+    ):
+        # Treat empty strings as missing, like pandas.read_csv does
+        table = pa_csv.read_csv(
+            csv_path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                strings_can_be_null=True
+            )
+        )
+        _write_table(table, parquet_path)
+    return parquet_path
+
+
+def _read_columns(csv_path: Path, columns: List[str], dtypes: Dict[str, str]) -> pd.DataFrame:
+    """
+    Read selected columns of a CSV file, via its parquet copy when possible.
+    
+    Args:
+        csv_path: Path to the source CSV file
+        columns: Columns to read
+        dtypes: Target dtypes for numeric columns; integer casts are skipped
+            for columns with missing values
+    
+    Returns:
+        DataFrame with the requested columns
+    """
+    df = None
+    if PYARROW_AVAILABLE:
+        try:
+            # Only the requested columns are decoded; self_destruct releases
+            # each Arrow buffer as soon as it has been converted
+            parquet_path = _ensure_parquet(csv_path, columns)
+            table = ds.dataset(parquet_path, format='parquet').to_table(columns=columns)
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
+        except (OSError, ValueError) as e:
+            # ValueError covers pyarrow.ArrowInvalid (e.g. CSV type inference failures)
+            print(f"Warning: parquet cache unavailable for {csv_path}: {str(e)}")
+    if df is None:
+        df = pd.read_csv(csv_path, usecols=columns)
+    
+    casts = {
+        col: dtype for col, dtype in dtypes.items()
+        if dtype.startswith('float') or not df[col].isna().any()
+    }
+    return df.astype(casts)
+
+
+@lru_cache(maxsize=1)
+def _load_weather(mtime: float) -> pd.DataFrame:
+    """Read the weather columns once per weather CSV mtime."""
+    return _read_columns(WEATHER_PATH, WEATHER_COLUMNS, WEATHER_DTYPES)
 
 
 def load_weather_data() -> pd.DataFrame:
-    """Load weather data from CSV file."""
-    backend_dir = Path(__file__).parent.parent
-    weather_path = backend_dir / 'data' / '1_demand_forecasting' / 'maine_weather_1997_2025.csv'
+    """
+    Load weather data from CSV file (cached; callers must not mutate the result).
     
-    if not weather_path.exists():
-        raise FileNotFoundError(f"Weather data not found: {weather_path}")
+    The cache is keyed on the file's mtime, so edits to the CSV are picked up
+    on the next call.
+    """
+    if not WEATHER_PATH.exists():
+        raise FileNotFoundError(f"Weather data not found: {WEATHER_PATH}")
     
-    df = pd.read_csv(weather_path)
-    return df
+    return _load_weather(WEATHER_PATH.stat().st_mtime)
+
+
+def _ops_sources_mtime() -> float:
+    """Latest modification time of the files the ops-with-weather frame is read from."""
+    if OPS_WEATHER_PATH.exists():
+        return OPS_WEATHER_PATH.stat().st_mtime
+    from utils.getData import DATA_PATH
+    return max(os.path.getmtime(DATA_PATH), WEATHER_PATH.stat().st_mtime)
 
 
 def load_operational_with_weather() -> pd.DataFrame:
-    """Load operational data with weather merged."""
-    backend_dir = Path(__file__).parent.parent
-    ops_weather_path = backend_dir / 'data' / 'processed' / 'operational_with_weather.csv'
+    """
+    Load operational data with weather merged (cached; callers must not mutate the result).
     
-    if ops_weather_path.exists():
-        df = pd.read_csv(ops_weather_path)
-        return df
+    'tdate' is parsed once here and becomes the frame's DatetimeIndex; rows
+    without a valid date are dropped. The cache is keyed on the source files'
+    mtime, so edits are picked up on the next call.
+    """
+    return _load_ops_with_weather(_ops_sources_mtime())
+
+
+@lru_cache(maxsize=1)
+def _load_ops_with_weather(sources_mtime: float) -> pd.DataFrame:
+    """Build the ops-with-weather frame once per source files mtime."""
+    if OPS_WEATHER_PATH.exists():
+        df = _read_columns(OPS_WEATHER_PATH, OPS_WEATHER_COLUMNS, OPS_WEATHER_DTYPES)
+        df['tdate'] = pd.to_datetime(df['tdate'], errors='coerce', format='ISO8601', cache=True)
+        return df[df['tdate'].notna()].set_index('tdate')
     
     # If merged data doesn't exist, try to merge on the fly
     from utils.getData import read_data
     
     ops_df = read_data()
-    weather_df = load_weather_data()
+    weather_df = load_weather_data().copy(deep=False)
     
     # Simple merge: match by month/year
     ops_df['tdate'] = pd.to_datetime(ops_df['tdate'], errors='coerce')
     ops_df['year'] = ops_df['tdate'].dt.year
     ops_df['month'] = ops_df['tdate'].dt.month
     
-    # Parse month from weather data
-    weather_df['month_name'] = weather_df['Month'].str.split(', ').str[0]
-    weather_df['year'] = weather_df['Month'].str.split(', ').str[1].astype(int)
-    month_map = {
-        'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-        'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12
-    }
-    weather_df['month'] = weather_df['month_name'].map(month_map)
+    # Parse month from weather data (format: "Month, Year")
+    weather_date = pd.to_datetime(weather_df['Month'], format='%B, %Y', cache=True)
+    weather_df['year'] = weather_date.dt.year
+    weather_df['month'] = weather_date.dt.month
     
     # Merge
     merged_df = ops_df.merge(
@@ -73,7 +233,7 @@ def load_operational_with_weather() -> pd.DataFrame:
         'Precip': 'precip'
     })
     
-    return merged_df
+    return merged_df[merged_df['tdate'].notna()].set_index('tdate')
 
 
 def define_extreme_weather_days(
@@ -90,21 +250,22 @@ def define_extreme_weather_days(
     Returns:
         DataFrame with extreme_weather flag
     """
-    df = weather_df.copy()
+    # Shallow copy: only columns are added, so the input's data can be shared
+    df = weather_df.copy(deep=False)
     
     if method == 'precipitation':
         # Define extreme precipitation (e.g., > 95th percentile)
         precip_threshold = df['Precip'].quantile(0.95) if 'Precip' in df.columns else 0
-        df['extreme_weather'] = (df['Precip'] > precip_threshold).astype(int)
+        df['extreme_weather'] = (df['Precip'] > precip_threshold).astype('int8')
         
     elif method == 'temperature':
         # Define extreme temperature (very hot or very cold)
         if 'AvgTemp' in df.columns:
             temp_95th = df['AvgTemp'].quantile(0.95)
             temp_5th = df['AvgTemp'].quantile(0.05)
-            df['extreme_weather'] = ((df['AvgTemp'] > temp_95th) | (df['AvgTemp'] < temp_5th)).astype(int)
+            df['extreme_weather'] = ((df['AvgTemp'] > temp_95th) | (df['AvgTemp'] < temp_5th)).astype('int8')
         else:
-            df['extreme_weather'] = 0
+            df['extreme_weather'] = np.int8(0)
             
     elif method == 'combined':
         # Combine precipitation and temperature
@@ -117,7 +278,7 @@ def define_extreme_weather_days(
             extreme_temp = False
         
         extreme_precip = (df['Precip'] > precip_threshold) if 'Precip' in df.columns else False
-        df['extreme_weather'] = (extreme_precip | extreme_temp).astype(int)
+        df['extreme_weather'] = (extreme_precip | extreme_temp).astype('int8')
     
     return df
 
@@ -136,18 +297,13 @@ def calculate_extreme_weather_frequency(
     Returns:
         DataFrame with extreme weather frequency by period
     """
-    df = weather_df.copy()
+    df = weather_df.copy(deep=False)
     
     # Parse date from Month column (format: "Month, Year")
     if 'Month' in df.columns:
-        df['month_name'] = df['Month'].str.split(', ').str[0]
-        df['year'] = df['Month'].str.split(', ').str[1].astype(int)
-        month_map = {
-            'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-            'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12
-        }
-        df['month'] = df['month_name'].map(month_map)
-        df['date'] = pd.to_datetime(df[['year', 'month']].assign(day=1))
+        df['date'] = pd.to_datetime(df['Month'], format='%B, %Y', cache=True)
+        df['year'] = df['date'].dt.year
+        df['month'] = df['date'].dt.month
     elif 'Date' in df.columns:
         df['date'] = pd.to_datetime(df['Date'], errors='coerce')
     elif 'Year' in df.columns and 'month' in df.columns:
@@ -168,68 +324,302 @@ def calculate_extreme_weather_frequency(
         raise ValueError(f"Unknown aggregation_level: {aggregation_level}")
     
     # Calculate extreme weather frequency
-    period_agg = df.groupby('period').agg({
-        'extreme_weather': 'sum',  # Count of extreme weather days
-        'date': 'count'  # Total days in period
-    }).reset_index()
-    period_agg.columns = ['period', 'extreme_days', 'total_days']
+    grouped = df.groupby('period', sort=False, observed=True)['extreme_weather']
+    period_agg = pd.DataFrame({
+        'extreme_days': grouped.sum(),  # Count of extreme weather days
+        'total_days': grouped.size()  # Total days in period (dates are non-null here)
+    }).rename_axis('period').reset_index()
     period_agg['extreme_frequency'] = period_agg['extreme_days'] / period_agg['total_days'] * 100
     
     return period_agg
 
 
+def _index_by_tdate(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the frame indexed by its parsed 'tdate', without rows lacking a valid date.
+    
+    Frames that already have a DatetimeIndex (as returned by
+    load_operational_with_weather) are returned as is.
+    
+    Args:
+        df: Operational data, indexed by date or with a 'tdate' column
+    
+    Returns:
+        DataFrame with a DatetimeIndex named 'tdate'
+    """
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df
+    df = df.assign(tdate=pd.to_datetime(df['tdate'], errors='coerce'))
+    return df[df['tdate'].notna()].set_index('tdate')
+
+
+def _year_month_key(year: pd.Series, month: pd.Series) -> pd.Series:
+    """Combine year and month into a single int32 join key (year * 12 + month)."""
+    return year.astype('int32') * 12 + month.astype('int32')
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _extreme_freq_kernel(precip, avg_temp, period_id, p_hi, t_hi, t_lo, n_groups):
+        """Count extreme and total rows per period in a single pass."""
+        # Serial loop: the per-period counters are scatter-adds, which would race under prange
+        extreme_days = np.zeros(n_groups, np.int64)
+        total_days = np.zeros(n_groups, np.int64)
+        for i in range(precip.size):
+            pid = period_id[i]
+            total_days[pid] += 1
+            if precip[i] > p_hi or avg_temp[i] > t_hi or avg_temp[i] < t_lo:
+                extreme_days[pid] += 1
+        return extreme_days, total_days
+
+
+def _extreme_frequency_numba(weather_df: pd.DataFrame, method: str) -> pd.DataFrame:
+    """
+    Monthly extreme weather frequency via the fused numba kernel.
+    
+    Equivalent to define_extreme_weather_days() followed by
+    calculate_extreme_weather_frequency(aggregation_level='month'); criteria a
+    method does not use get infinite thresholds so they never fire.
+    
+    Args:
+        weather_df: Weather data DataFrame
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+    
+    Returns:
+        DataFrame with period, extreme_days, total_days and extreme_frequency columns
+    """
+    if method not in ('precipitation', 'temperature', 'combined'):
+        raise ValueError(f"Unknown method: {method}")
+    
+    precip = weather_df['Precip']
+    avg_temp = weather_df['AvgTemp']
+    p_hi = precip.quantile(0.95) if method != 'temperature' else np.inf
+    if method != 'precipitation':
+        t_hi, t_lo = avg_temp.quantile(0.95), avg_temp.quantile(0.05)
+    else:
+        t_hi, t_lo = np.inf, -np.inf
+    
+    date = pd.to_datetime(weather_df['Month'], format='%B, %Y', cache=True)
+    valid = date.notna().to_numpy()
+    period_id, periods = pd.factorize(date[valid].dt.to_period('M'))
+    extreme_days, total_days = _extreme_freq_kernel(
+        precip.to_numpy()[valid], avg_temp.to_numpy()[valid], period_id,
+        float(p_hi), float(t_hi), float(t_lo), len(periods)
+    )
+    
+    return pd.DataFrame({
+        'period': periods,
+        'extreme_days': extreme_days,
+        'total_days': total_days,
+        'extreme_frequency': extreme_days / total_days * 100
+    })
+
+
+def _monthly_extreme_frequency(method: str) -> pd.DataFrame:
+    """
+    Calculate monthly extreme weather frequency, keyed by year and month.
+    
+    Args:
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+    
+    Returns:
+        DataFrame with period, year, month and extreme_frequency columns
+    """
+    weather_df = load_weather_data()
+    if NUMBA_AVAILABLE:
+        weather_freq = _extreme_frequency_numba(weather_df, method)
+    else:
+        weather_df = define_extreme_weather_days(weather_df, method=method)
+        weather_freq = calculate_extreme_weather_frequency(weather_df, aggregation_level='month')
+    
+    # Convert period to year-month for merging
+    weather_freq['year'] = weather_freq['period'].dt.year
+    weather_freq['month'] = weather_freq['period'].dt.month
+    weather_freq['ym'] = _year_month_key(weather_freq['year'], weather_freq['month'])
+    
+    return weather_freq
+
+
+def _weather_freq_cache_path(method: str) -> Path:
+    """Path of the parquet file caching the monthly extreme weather frequency for a method."""
+    return PROCESSED_DIR / f'weather_monthly_extreme_freq_{method}.parquet'
+
+
+@lru_cache(maxsize=8)
+def _load_weather_freq(method: str, weather_mtime: float) -> pd.DataFrame:
+    """
+    Load the monthly extreme weather frequency for a method, building it if needed.
+    
+    The table is read from its parquet cache while that is newer than the
+    weather CSV, and otherwise rebuilt and written back. The mtime is part of
+    the in-process cache key, so editing the CSV invalidates both.
+    
+    Args:
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+        weather_mtime: Modification time of the weather CSV
+    
+    Returns:
+        DataFrame with period, year, month, ym and extreme_frequency columns
+    """
+    cache_path = _weather_freq_cache_path(method)
+    if PYARROW_AVAILABLE:
+        try:
+            if cache_path.exists() and cache_path.stat().st_mtime >= weather_mtime:
+                return pd.read_parquet(cache_path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read {cache_path}: {str(e)}")
+    
+    weather_freq = _monthly_extreme_frequency(method)
+    
+    if PYARROW_AVAILABLE:
+        try:
+            _write_table(pa.Table.from_pandas(weather_freq, preserve_index=False), cache_path)
+        except (OSError, ValueError) as e:
+            # Cache writes are best effort; the result is still returned
+            print(f"Warning: could not write {cache_path}: {str(e)}")
+    return weather_freq
+
+
+def _get_or_build_weather_freq(method: str) -> pd.DataFrame:
+    """
+    Get the monthly extreme weather frequency for a method (cached; callers must not mutate the result).
+    
+    Args:
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+    
+    Returns:
+        DataFrame with period, year, month, ym and extreme_frequency columns
+    """
+    return _load_weather_freq(method, WEATHER_PATH.stat().st_mtime)
+
+
+def quantile_bin_codes(values: np.ndarray, quantiles: List[float]) -> Tuple[List[str], np.ndarray]:
+    """
+    Assign values to quantile bins with a binary search over the bin edges.
+    
+    Q{i+1} covers [q_i, q_{i+1}); values outside the edges (at or above the top
+    one) get the final "+" label.
+    
+    Args:
+        values: Values to bin (without NaN)
+        quantiles: List of quantile thresholds
+    
+    Returns:
+        Tuple of (labels, codes) where codes index into labels
+    """
+    quantile_values = np.quantile(values, quantiles)
+    n_edges = len(quantile_values)
+    labels = [
+        f"Q{i+1} ({quantile_values[i]:.1f}-{quantile_values[i+1]:.1f}%)"
+        for i in range(n_edges - 1)
+    ] + [f"Q{n_edges} ({quantile_values[-1]:.1f}%+)"]
+    codes = np.searchsorted(quantile_values, values, side='right') - 1
+    codes[(codes < 0) | (codes >= n_edges - 1)] = n_edges - 1
+    return labels, codes
+
+
 def stratify_by_weather_quantiles(
     merged_df: pd.DataFrame,
-    quantiles: List[float] = [0.0, 0.25, 0.5, 0.75, 1.0]
+    quantiles: List[float] = [0.0, 0.25, 0.5, 0.75, 1.0],
+    weather_freq: Optional[pd.DataFrame] = None
 ) -> pd.DataFrame:
     """
     Stratify operational data by extreme weather frequency quantiles.
     
     Args:
-        merged_df: Operational data with weather information
+        merged_df: Operational data with weather information, indexed by date
+            (or with a 'tdate' column)
         quantiles: List of quantile thresholds
+        weather_freq: Monthly extreme weather frequency with 'ym' and
+            'extreme_frequency' columns (default: the precipitation-based table)
     
     Returns:
-        DataFrame with weather_quantile label added
+        DataFrame indexed by date with weather_quantile label added
     """
-    df = merged_df.copy()
+    df = _index_by_tdate(merged_df).copy(deep=False)
+    df['ym'] = _year_month_key(df.index.year, df.index.month)
     
-    # Extract date from operational data
-    df['tdate'] = pd.to_datetime(df['tdate'], errors='coerce')
-    df = df[df['tdate'].notna()]
-    df['year'] = df['tdate'].dt.year
-    df['month'] = df['tdate'].dt.month
+    # Get monthly extreme weather frequency
+    if weather_freq is None:
+        weather_freq = _get_or_build_weather_freq('precipitation')
     
-    # Get weather data and calculate extreme weather frequency
-    weather_df = load_weather_data()
-    weather_df = define_extreme_weather_days(weather_df, method='precipitation')
-    weather_freq = calculate_extreme_weather_frequency(weather_df, aggregation_level='month')
+    # Look up weather frequency for each operational row on the single integer key
+    df['extreme_frequency'] = df['ym'].map(weather_freq.set_index('ym')['extreme_frequency'])
     
-    # Convert period to year-month for merging
-    weather_freq['year'] = weather_freq['period'].astype(str).str[:4].astype(int)
-    weather_freq['month'] = weather_freq['period'].astype(str).str[5:7].astype(int)
+    # Calculate quantiles of extreme_frequency (months without weather data count as 0)
+    freq_arr = np.nan_to_num(df['extreme_frequency'].to_numpy(dtype=float), nan=0.0)
+    df['extreme_frequency'] = freq_arr
+    labels, codes = quantile_bin_codes(freq_arr, quantiles)
+    df['weather_quantile'] = pd.Categorical.from_codes(codes, categories=labels)
     
-    # Merge weather frequency with operational data
-    df = df.merge(
-        weather_freq[['year', 'month', 'extreme_frequency']],
-        on=['year', 'month'],
-        how='left'
-    )
+    return df
+
+
+def _stratified_cache_path(method: str, quantiles: Tuple[float, ...]) -> Path:
+    """Path of the parquet file caching the stratified operational frame for (method, quantiles)."""
+    digest = hashlib.md5(repr(quantiles).encode()).hexdigest()[:12]
+    return PROCESSED_DIR / f'strat_v{STRATIFIED_CACHE_VERSION}_{method}_{digest}.parquet'
+
+
+def _stratified_sources_mtime() -> float:
+    """Latest modification time of the files the stratified frame is derived from."""
+    return max(_ops_sources_mtime(), WEATHER_PATH.stat().st_mtime)
+
+
+@lru_cache(maxsize=16)
+def _load_stratified(method: str, quantiles: Tuple[float, ...], sources_mtime: float) -> pd.DataFrame:
+    """
+    Load the stratified operational frame for (method, quantiles), building it if needed.
     
-    # Calculate quantiles of extreme_frequency
-    df['extreme_frequency'] = df['extreme_frequency'].fillna(0)
-    quantile_values = df['extreme_frequency'].quantile(quantiles).values
+    Only STRATIFIED_COLUMNS are kept. The frame is read from its parquet cache
+    while that is newer than the source files, and otherwise rebuilt with
+    stratify_by_weather_quantiles() and written back.
     
-    # Assign quantile labels
-    def assign_quantile(value):
-        for i in range(len(quantile_values) - 1):
-            if quantile_values[i] <= value < quantile_values[i + 1]:
-                return f"Q{i+1} ({quantile_values[i]:.1f}-{quantile_values[i+1]:.1f}%)"
-        return f"Q{len(quantile_values)} ({quantile_values[-1]:.1f}%+)"
+    Args:
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+        quantiles: Quantile thresholds
+        sources_mtime: Latest modification time of the source files
     
-    df['weather_quantile'] = df['extreme_frequency'].apply(assign_quantile)
+    Returns:
+        DataFrame indexed by date with weather_quantile and Incident Number columns
+    """
+    cache_path = _stratified_cache_path(method, quantiles)
+    if PYARROW_AVAILABLE:
+        try:
+            if cache_path.exists() and cache_path.stat().st_mtime >= sources_mtime:
+                return pd.read_parquet(cache_path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: could not read {cache_path}: {str(e)}")
+    
+    ops_df = stratify_by_weather_quantiles(
+        load_operational_with_weather(),
+        list(quantiles),
+        weather_freq=_get_or_build_weather_freq(method)
+    )
+    ops_df = ops_df[STRATIFIED_COLUMNS]
+    
+    if PYARROW_AVAILABLE:
+        try:
+            _write_table(pa.Table.from_pandas(ops_df, preserve_index=True), cache_path)
+        except (OSError, ValueError) as e:
+            # Cache writes are best effort; the result is still returned
+            print(f"Warning: could not write {cache_path}: {str(e)}")
+    return ops_df
+
+
+def _get_or_build_stratified(method: str, quantiles: List[float]) -> pd.DataFrame:
+    """
+    Get the stratified operational frame (cached; callers must not mutate the result).
     
-    return df
+    Args:
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+        quantiles: List of quantile thresholds
+    
+    Returns:
+        DataFrame indexed by date with weather_quantile and Incident Number columns
+    """
+    key = tuple(float(q) for q in quantiles)
+    return _load_stratified(method, key, _stratified_sources_mtime())
 
 
 def calculate_mission_distribution_by_weather(
@@ -240,51 +630,57 @@ def calculate_mission_distribution_by_weather(
     Calculate mission count distribution by weather quantile.
     
     Args:
-        merged_df: Operational data with weather quantile labels
+        merged_df: Operational data with weather quantile labels, indexed by
+            date (or with a 'tdate' column)
         aggregation_level: 'day', 'month', 'week'
     
     Returns:
-        Dictionary with boxplot data for each weather quantile
+        Dictionary with boxplot data for each weather quantile ('values' holds
+        the per-period mission counts as a numpy array)
     """
-    df = merged_df.copy()
-    
-    # Extract date components
-    df['tdate'] = pd.to_datetime(df['tdate'], errors='coerce')
-    df = df[df['tdate'].notna()]
+    df = _index_by_tdate(merged_df).copy(deep=False)
     
     # Aggregate by period and weather quantile
     if aggregation_level == 'day':
-        df['period'] = df['tdate'].dt.date
+        df['period'] = df.index.normalize()
     elif aggregation_level == 'month':
-        df['period'] = df['tdate'].dt.to_period('M')
+        df['period'] = df.index.to_period('M')
     elif aggregation_level == 'week':
-        df['period'] = df['tdate'].dt.to_period('W')
+        df['period'] = df.index.to_period('W')
     else:
         raise ValueError(f"Unknown aggregation_level: {aggregation_level}")
     
-    # Count missions by period and weather quantile
-    period_agg = df.groupby(['period', 'weather_quantile']).agg({
-        'Incident Number': 'count'
-    }).reset_index()
-    period_agg.columns = ['period', 'weather_quantile', 'mission_count']
+    # Count missions by period and weather quantile (rows without an incident
+    # number are not missions); categorical keys let the grouper hash codes
+    df = df[df['Incident Number'].notna()]
+    if not isinstance(df['weather_quantile'].dtype, pd.CategoricalDtype):
+        df['weather_quantile'] = df['weather_quantile'].astype('category')
+    period_agg = df.groupby(
+        ['period', 'weather_quantile'], sort=False, observed=True
+    ).size().reset_index(name='mission_count')
+    
+    # Prepare boxplot data: all summary statistics in one grouped pass
+    grouped = period_agg.groupby('weather_quantile', sort=False, observed=True)['mission_count']
+    stats_df = grouped.agg(['min', 'median', 'max', 'mean', 'count'])
+    stats_df['std'] = grouped.std(ddof=0)  # population std, as np.std
+    quartiles = grouped.quantile([0.25, 0.75]).unstack()
+    stats_df['q1'] = quartiles[0.25]
+    stats_df['q3'] = quartiles[0.75]
+    values_by_quantile = {quantile: group.to_numpy() for quantile, group in grouped}
     
-    # Prepare boxplot data
     boxplot_data = {}
-    for quantile in period_agg['weather_quantile'].unique():
-        quantile_data = period_agg[period_agg['weather_quantile'] == quantile]['mission_count'].values
-        
-        if len(quantile_data) > 0:
-            boxplot_data[quantile] = {
-                'values': quantile_data.tolist(),
-                'min': float(np.min(quantile_data)),
-                'q1': float(np.percentile(quantile_data, 25)),
-                'median': float(np.median(quantile_data)),
-                'q3': float(np.percentile(quantile_data, 75)),
-                'max': float(np.max(quantile_data)),
-                'mean': float(np.mean(quantile_data)),
-                'std': float(np.std(quantile_data)),
-                'count': int(len(quantile_data))
-            }
+    for row in stats_df.itertuples():
+        boxplot_data[row.Index] = {
+            'values': values_by_quantile[row.Index],
+            'min': float(row.min),
+            'q1': float(row.q1),
+            'median': float(row.median),
+            'q3': float(row.q3),
+            'max': float(row.max),
+            'mean': float(row.mean),
+            'std': float(row.std),
+            'count': int(row.count)
+        }
     
     return boxplot_data
 
@@ -309,8 +705,7 @@ def get_weather_risk_analysis(
         quantiles = [0.0, 0.25, 0.5, 0.75, 1.0]
     
     # Load and prepare data
-    ops_df = load_operational_with_weather()
-    ops_df = stratify_by_weather_quantiles(ops_df, quantiles)
+    ops_df = _get_or_build_stratified(method, quantiles)
     
     # Calculate mission distribution
     boxplot_data = calculate_mission_distribution_by_weather(ops_df, aggregation_level)
@@ -318,6 +713,9 @@ def get_weather_risk_analysis(
     # Prepare data for visualization
     boxplot_series = []
     for quantile, stats in sorted(boxplot_data.items()):
+        values = stats['values']
+        iqr = stats['q3'] - stats['q1']
+        outlier_mask = (values < stats['q1'] - 1.5 * iqr) | (values > stats['q3'] + 1.5 * iqr)
         boxplot_series.append({
             'quantile': quantile,
             'min': stats['min'],
@@ -326,7 +724,7 @@ def get_weather_risk_analysis(
             'q3': stats['q3'],
             'max': stats['max'],
             'mean': stats['mean'],
-            'outliers': [v for v in stats['values'] if v < stats['q1'] - 1.5 * (stats['q3'] - stats['q1']) or v > stats['q3'] + 1.5 * (stats['q3'] - stats['q1'])]
+            'outliers': values[outlier_mask].tolist()
         })
     
     return {
@@ -0,0 +1,196 @@
+# backend/utils/weather_risk_2_4_polars.py
+"""
+Polars implementation of the Weather-Driven Risk Boxes analysis (Chart 2.4).
+
+Mirrors get_weather_risk_analysis() from utils.weather_risk_2_4 and returns the
+same structure, but builds the load -> extreme flag -> monthly frequency ->
+join pipeline as a Polars LazyFrame so that column pruning is pushed into the
+CSV scans and the whole plan runs on the multi-threaded streaming engine.
+
+Polars is optional; POLARS_AVAILABLE tells callers whether this module can be used.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Any
+from pathlib import Path
+from utils.weather_risk_2_4 import quantile_bin_codes
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+    print("Warning: polars not available. Use utils.weather_risk_2_4 instead.")
+
+BACKEND_DIR = Path(__file__).parent.parent
+WEATHER_PATH = BACKEND_DIR / 'data' / '1_demand_forecasting' / 'maine_weather_1997_2025.csv'
+OPS_WEATHER_PATH = BACKEND_DIR / 'data' / 'processed' / 'operational_with_weather.csv'
+
+
+def _extreme_weather_expr(method: str) -> 'pl.Expr':
+    """
+    Build the extreme weather flag expression (same thresholds as the pandas version).
+
+    Args:
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+
+    Returns:
+        Int8 expression: 1 for an extreme weather row, 0 otherwise
+    """
+    precip = pl.col('Precip')
+    temp = pl.col('AvgTemp')
+    extreme_precip = precip > precip.quantile(0.95, interpolation='linear')
+    extreme_temp = (
+        (temp > temp.quantile(0.95, interpolation='linear'))
+        | (temp < temp.quantile(0.05, interpolation='linear'))
+    )
+
+    if method == 'precipitation':
+        flag = extreme_precip
+    elif method == 'temperature':
+        flag = extreme_temp
+    elif method == 'combined':
+        flag = extreme_precip | extreme_temp
+    else:
+        raise ValueError(f"Unknown method: {method}")
+
+    # Missing readings never count as extreme (NaN comparisons are False in pandas)
+    return flag.fill_null(False).cast(pl.Int8)
+
+
+def _monthly_extreme_frequency(method: str) -> 'pl.LazyFrame':
+    """
+    Lazily compute monthly extreme weather frequency, keyed by year and month.
+
+    Args:
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+
+    Returns:
+        LazyFrame with year, month and extreme_frequency columns
+    """
+    return (
+        pl.scan_csv(WEATHER_PATH, schema_overrides={'Precip': pl.Float32, 'AvgTemp': pl.Float32})
+        .select(['Month', 'AvgTemp', 'Precip'])
+        .with_columns(
+            pl.col('Month').str.strptime(pl.Date, '%B, %Y'),
+            _extreme_weather_expr(method).alias('extreme_weather')
+        )
+        .drop_nulls('Month')
+        .group_by(
+            pl.col('Month').dt.year().alias('year'),
+            pl.col('Month').dt.month().alias('month')
+        )
+        .agg((pl.col('extreme_weather').mean() * 100).alias('extreme_frequency'))
+    )
+
+
+def _period_expr(aggregation_level: str) -> 'pl.Expr':
+    """
+    Build the mission aggregation period expression from the parsed 'tdate'.
+
+    Args:
+        aggregation_level: 'day', 'month', 'week'
+
+    Returns:
+        Date expression identifying the period
+    """
+    tdate = pl.col('tdate')
+    if aggregation_level == 'day':
+        return tdate
+    elif aggregation_level == 'month':
+        return tdate.dt.truncate('1mo')
+    elif aggregation_level == 'week':
+        # Monday-start weeks, the same grouping as pandas' 'W' (week ending Sunday)
+        return tdate.dt.truncate('1w')
+    raise ValueError(f"Unknown aggregation_level: {aggregation_level}")
+
+
+def get_weather_risk_analysis(
+    method: str = 'precipitation',
+    aggregation_level: str = 'day',
+    quantiles: Optional[List[float]] = None
+) -> Dict[str, Any]:
+    """
+    Main function to get weather risk analysis results (Polars engine).
+
+    Args:
+        method: Method to define extreme weather ('precipitation', 'temperature', 'combined')
+        aggregation_level: Level to aggregate missions ('day', 'month', 'week')
+        quantiles: List of quantile thresholds (default: [0.0, 0.25, 0.5, 0.75, 1.0])
+
+    Returns:
+        Dictionary with weather risk analysis results
+    """
+    if not POLARS_AVAILABLE:
+        raise ImportError("polars is required for utils.weather_risk_2_4_polars")
+    if quantiles is None:
+        quantiles = [0.0, 0.25, 0.5, 0.75, 1.0]
+    period = _period_expr(aggregation_level)
+
+    # Operational rows joined to the monthly extreme weather frequency
+    ops = (
+        pl.scan_csv(OPS_WEATHER_PATH, schema_overrides={'tdate': pl.Utf8, 'Incident Number': pl.Utf8})
+        .select(['tdate', 'Incident Number'])
+        .with_columns(pl.col('tdate').str.to_date(strict=False))
+        .drop_nulls('tdate')
+        .with_columns(
+            pl.col('tdate').dt.year().alias('year'),
+            pl.col('tdate').dt.month().alias('month'),
+            period.alias('period')
+        )
+        .join(_monthly_extreme_frequency(method), on=['year', 'month'],
+              how='left', maintain_order='left')
+        .select(
+            'period',
+            'Incident Number',
+            pl.col('extreme_frequency').fill_null(0.0)
+        )
+        .collect(engine='streaming')
+    )
+
+    # Quantile labels and per-row bin codes, shared with the pandas version
+    labels, codes = quantile_bin_codes(ops['extreme_frequency'].to_numpy(), quantiles)
+
+    # Count missions by period and weather quantile, then summarise per quantile
+    mission_counts = (
+        ops.with_columns(pl.Series('quantile_code', codes, dtype=pl.Int32))
+        .group_by(['period', 'quantile_code'], maintain_order=True)
+        .agg(pl.col('Incident Number').count().alias('mission_count'))
+    )
+    count = pl.col('mission_count')
+    stats_df = mission_counts.group_by('quantile_code', maintain_order=True).agg(
+        count.min().alias('min'),
+        count.quantile(0.25, interpolation='linear').alias('q1'),
+        count.median().alias('median'),
+        count.quantile(0.75, interpolation='linear').alias('q3'),
+        count.max().alias('max'),
+        count.mean().alias('mean'),
+        count.alias('values')
+    )
+
+    # Prepare data for visualization
+    boxplot_series = []
+    for stats in stats_df.iter_rows(named=True):
+        values = np.asarray(stats['values'])
+        iqr = stats['q3'] - stats['q1']
+        outlier_mask = (values < stats['q1'] - 1.5 * iqr) | (values > stats['q3'] + 1.5 * iqr)
+        boxplot_series.append({
+            'quantile': labels[stats['quantile_code']],
+            'min': float(stats['min']),
+            'q1': float(stats['q1']),
+            'median': float(stats['median']),
+            'q3': float(stats['q3']),
+            'max': float(stats['max']),
+            'mean': float(stats['mean']),
+            'outliers': values[outlier_mask].tolist()
+        })
+    boxplot_series.sort(key=lambda item: item['quantile'])
+
+    return {
+        'boxplot_data': boxplot_series,
+        'metadata': {
+            'method': method,
+            'aggregation_level': aggregation_level,
+            'quantiles': quantiles,
+            'n_quantiles': len(boxplot_series)
+        }
+    }